@@ -31,35 +31,35 @@ from fivcadvisor.agents.types import (
     AgentsCreatorBase,
 )
 
+# keyword arguments accepted by strands Agent
+_AGENT_KWARGS = frozenset(
+    [
+        "model",
+        "messages",
+        "tools",
+        "system_prompt",
+        "callback_handler",
+        "conversation_manager",
+        "record_direct_tool_call",
+        "load_tools_from_directory",
+        "trace_attributes",
+        "agent_id",
+        "name",
+        "description",
+        "state",
+        "hooks",
+        "session_manager",
+        "tool_executor",
+    ]
+)
+
 
 @agent_creator("Generic")
 def create_default_agent(*args, **kwargs) -> Agent:
     """Create a standard ReAct agent for task execution."""
 
     # filter out unknown kwargs
-    kwargs = {
-        k: v
-        for k, v in kwargs.items()
-        if k
-        in [
-            "model",
-            "messages",
-            "tools",
-            "system_prompt",
-            "callback_handler",
-            "conversation_manager",
-            "record_direct_tool_call",
-            "load_tools_from_directory",
-            "trace_attributes",
-            "agent_id",
-            "name",
-            "description",
-            "state",
-            "hooks",
-            "session_manager",
-            "tool_executor",
-        ]
-    }
+    kwargs = {k: v for k, v in kwargs.items() if k in _AGENT_KWARGS}
 
     # Set default role if not provided
     kwargs.setdefault("name", "Generic")
@@ -228,10 +228,13 @@ def create_generic_agent_swarm(
     if not tools_retriever:
         raise RuntimeError("tools_retriever not provided")
 
+    # fetch each tool once, specialists often share tools
+    tool_names = list(dict.fromkeys(n for s in team.specialists for n in s.tools))
+    team_tools = dict(zip(tool_names, tools_retriever.get_batch(tool_names)))
+
     s_agents = []
     for s in team.specialists:
-        s_tools = tools_retriever.get_batch(s.tools)
-        s_tools = [t for t in s_tools if t is not None]
+        s_tools = [team_tools[n] for n in s.tools if team_tools[n] is not None]
         s_agents.append(
             create_default_agent(
                 name=s.name,
@@ -475,9 +475,7 @@ class AgentsMonitorManager(object):
 
         # Retrieve tools according to query
         agent_tools = tools_retriever.retrieve(query)
-        tool_names = [
-            i.tool_name if hasattr(i, "tool_name") else str(i) for i in agent_tools
-        ]
+        tool_names = [getattr(i, "tool_name", None) or str(i) for i in agent_tools]
         print(f"Agent Tools: {tool_names} for query: {query}")
 
         # Generate unique agent ID
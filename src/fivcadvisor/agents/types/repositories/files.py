@@ -47,7 +47,6 @@ Example:
     >>> agents = repo.list_agents()
 """
 
-import json
 import shutil
 from pathlib import Path
 from typing import Optional, List
@@ -217,10 +216,10 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
         agent_file = self._get_agent_file(agent.agent_id)
 
         # Serialize agent metadata to JSON
-        agent_data = agent.model_dump(mode="json")
+        agent_json = agent.model_dump_json(indent=2)
 
         with open(agent_file, "w", encoding="utf-8") as f:
-            json.dump(agent_data, f, indent=2, ensure_ascii=False)
+            f.write(agent_json)
 
     def get_agent(self, agent_id: str) -> Optional[AgentsRuntimeMeta]:
         """
@@ -250,11 +249,11 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
 
         try:
             with open(agent_file, "r", encoding="utf-8") as f:
-                agent_data = json.load(f)
+                agent_json = f.read()
 
             # Reconstruct AgentsRuntimeMeta from JSON
-            return AgentsRuntimeMeta.model_validate(agent_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return AgentsRuntimeMeta.model_validate_json(agent_json)
+        except ValueError as e:
             # Log error and return None if file is corrupted
             print(f"Error loading agent {agent_id}: {e}")
             return None
@@ -357,10 +356,10 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
         run_file = self._get_run_file(agent_id, str(agent_runtime.agent_run_id))
 
         # Serialize agent to JSON (exclude tool_calls as they're stored separately)
-        agent_data = agent_runtime.model_dump(mode="json", exclude={"tool_calls"})
+        agent_json = agent_runtime.model_dump_json(indent=2, exclude={"tool_calls"})
 
         with open(run_file, "w", encoding="utf-8") as f:
-            json.dump(agent_data, f, indent=2, ensure_ascii=False)
+            f.write(agent_json)
 
     def get_agent_runtime(
         self, agent_id: str, agent_run_id: str
@@ -395,12 +394,12 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
 
         try:
             with open(run_file, "r", encoding="utf-8") as f:
-                agent_data = json.load(f)
+                agent_json = f.read()
 
             # Reconstruct AgentsRuntime from JSON
             # Note: tool_calls are loaded separately via list_agent_runtime_tool_calls
-            return AgentsRuntime.model_validate(agent_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return AgentsRuntime.model_validate_json(agent_json)
+        except ValueError as e:
             # Log error and return None if file is corrupted
             print(f"Error loading agent {agent_id} run {agent_run_id}: {e}")
             return None
@@ -512,11 +511,11 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
 
         try:
             with open(tool_call_file, "r", encoding="utf-8") as f:
-                tool_call_data = json.load(f)
+                tool_call_json = f.read()
 
             # Reconstruct AgentsRuntimeToolCall from JSON
-            return AgentsRuntimeToolCall.model_validate(tool_call_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return AgentsRuntimeToolCall.model_validate_json(tool_call_json)
+        except ValueError as e:
             # Log error and return None if file is corrupted
             print(
                 f"Error loading tool call {tool_call_id} for agent {agent_id} run {agent_run_id}: {e}"
@@ -561,10 +560,10 @@ class FileAgentsRuntimeRepository(AgentsRuntimeRepository):
         )
 
         # Serialize tool call to JSON
-        tool_call_data = tool_call.model_dump(mode="json")
+        tool_call_json = tool_call.model_dump_json(indent=2)
 
         with open(tool_call_file, "w", encoding="utf-8") as f:
-            json.dump(tool_call_data, f, indent=2, ensure_ascii=False)
+            f.write(tool_call_json)
 
     def list_agent_runtime_tool_calls(
         self, agent_id: str, agent_run_id: str
@@ -33,8 +33,9 @@ Example:
     >>> history = chat.list_history()
 """
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Awaitable, List
 
 from strands.agent import AgentResult
 
@@ -320,7 +321,8 @@ class Chat(object):
         self,
         query: str,
         on_event: Optional[Callable[[AgentsRuntime], None]] = None,
-    ) -> AgentResult:
+        commit: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> Optional[AgentResult]:
         """
         Send a query to the agent and get a response.
 
@@ -340,10 +342,15 @@ class Chat(object):
                      - tool_calls: Dictionary of tool calls made so far
                      - status: Current execution status
                      The callback is called after each streaming chunk and tool call.
+            commit: Optional coroutine function awaited once the agent has
+                   answered. If it returns False or raises, or the call is
+                   cancelled, the run is deleted from the repository as if
+                   the query was never asked.
 
         Returns:
             AgentResult: The final result from the agent execution, containing
                         the complete response message and any tool results.
+                        None if the answer was discarded by commit.
 
         Raises:
             ValueError: If the agent is already processing a query (running=True).
@@ -406,8 +413,24 @@ class Chat(object):
                 **agent_kwargs,
             )
 
-            # Execute agent
-            agent_result = await agent.invoke_async(query)
+            # Execute agent, discard the run if it is not committed
+            try:
+                agent_result = await agent.invoke_async(query)
+            except asyncio.CancelledError:
+                self._discard(agent)
+                raise
+
+            if commit is not None:
+                try:
+                    committed = await commit()
+                except BaseException:
+                    self._discard(agent)
+                    raise
+
+                if not committed:
+                    self._discard(agent)
+                    return None
+
             # Save agent metadata on first query
             if not self.runtime_meta:
                 agent_query = f"{query}\n{str(agent_result)}"
@@ -430,6 +453,16 @@ class Chat(object):
             # Always reset running flag
             self.running = False
 
+    def _discard(self, agent) -> None:
+        """Delete the run of an answer that is not kept."""
+        if self.runtime_meta:
+            self.runtime_repo.delete_agent_runtime(
+                agent.agent_id, agent.callback_handler.id
+            )
+        else:
+            # new chat, nothing else has been stored for this agent
+            self.runtime_repo.delete_agent(agent.agent_id)
+
     def cleanup(self) -> None:
         """
         Clear conversation history and delete all agent data.
@@ -108,9 +108,7 @@ class ViewNavigation(object):
             section_name: Name of the section to add to
             page: ViewBase object to add
         """
-        if section_name not in self.sections:
-            self.sections[section_name] = []
-        self.sections[section_name].append(page)
+        self.sections.setdefault(section_name, []).append(page)
 
     @staticmethod
     def _get_current_page_id() -> Optional[str]:
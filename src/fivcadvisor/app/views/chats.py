@@ -16,6 +16,8 @@ system for tracking execution state and persistence.
 """
 
 import os
+from contextlib import suppress
+from typing import Callable, Optional
 
 import streamlit as st
 import asyncio
@@ -24,7 +26,7 @@ from strands.types.content import Message, ContentBlock
 
 from fivcadvisor.app.utils import Chat, default_running_config
 from fivcadvisor.app.components import ChatMessage
-from fivcadvisor.tasks import run_assessing_task
+from fivcadvisor.tasks import run_assessing_task, TaskAssessment
 from .base import ViewBase, ViewNavigation
 from ...agents.types import AgentsRuntime
 
@@ -56,6 +58,63 @@ class ChatView(ViewBase):
         # Navigate to the first available chat or new chat
         # The navigation will be handled by the caller via st.rerun()
 
+    async def _ask(
+        self,
+        query: str,
+        on_event: Optional[Callable[[AgentsRuntime], None]] = None,
+    ) -> Optional[TaskAssessment]:
+        """
+        Answer the query, unless it is assessed to require planning.
+
+        The assessment is only needed when tasks are enabled. If the
+        "speculative_chat" running config is set, the chat answer is started
+        alongside the assessment and discarded if planning turns out to be
+        required, so the common case costs one round-trip instead of two.
+
+        Returns:
+            The assessment if the query requires planning, None if answered.
+        """
+        if not default_running_config.get("enable_tasks"):
+            await self.chat.ask(query, on_event=on_event)
+            return None
+
+        assessing = asyncio.ensure_future(
+            run_assessing_task(
+                query,
+                tools_retriever=self.chat.tools_retriever,
+            )
+        )
+        if not default_running_config.get("speculative_chat"):
+            assessment = await assessing
+            if assessment.require_planning:
+                return assessment
+
+            await self.chat.ask(query, on_event=on_event)
+            return None
+
+        async def _commit() -> bool:
+            return not (await assessing).require_planning
+
+        asking = asyncio.create_task(
+            self.chat.ask(query, on_event=on_event, commit=_commit)
+        )
+        try:
+            assessment = await assessing
+        except BaseException:
+            asking.cancel()
+            raise
+
+        if assessment.require_planning:
+            # the chat drops the run whether it is cancelled or done,
+            # and a failed answer is thrown away all the same
+            asking.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await asking
+            return assessment
+
+        await asking
+        return None
+
     def render(self, nav: "ViewNavigation"):
         """
         Render the chat page with conversation history and input.
@@ -148,30 +207,20 @@ class ChatView(ViewBase):
             # Execute query with streaming callback
             is_new_chat = self.chat.id is None
 
-            # Assess query
+            # Assess and answer query
             assessment = asyncio.run(
-                run_assessing_task(
+                self._ask(
                     user_query,
-                    tools_retriever=self.chat.tools_retriever,
+                    on_event=lambda rt: ChatMessage(rt).render(msg_new_placeholder),
                 )
             )
-
-            if assessment.require_planning and default_running_config.get(
-                "enable_tasks"
-            ):
+            if assessment is not None:
                 msg_runtime.reply = Message(
                     role="assistant", content=[ContentBlock(text=assessment.reasoning)]
                 )
                 ChatMessage(msg_runtime).render(msg_new_placeholder)
                 return
 
-            asyncio.run(
-                self.chat.ask(
-                    user_query,
-                    on_event=lambda rt: ChatMessage(rt).render(msg_new_placeholder),
-                )
-            )
-
             if is_new_chat:
                 # Set the page_id and rerun to navigate to the new chat
                 nav.navigate_to(self.chat.id)
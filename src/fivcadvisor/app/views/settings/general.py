@@ -72,6 +72,25 @@ class GeneralSettingView(ViewBase):
             on_change=lambda: _on_change_enable_tasks(not enable_tasks_now),
         )
 
+        def _on_change_speculative_chat(enabled: bool):
+            """Callback for enabling/disabling speculative chat answers.
+
+            Args:
+                enabled (bool): Whether to answer while the query is assessed.
+            """
+            default_running_config.set("speculative_chat", enabled)
+            default_running_config.save()
+
+        speculative_chat = default_running_config.get("speculative_chat")
+        speculative_chat_now = st.toggle(
+            "Answer While Assessing",
+            speculative_chat,
+            disabled=not enable_tasks,
+            help="Start answering before the task assessment finishes. "
+            "Faster for simple queries, wastes tokens when a task is needed.",
+            on_change=lambda: _on_change_speculative_chat(not speculative_chat_now),
+        )
+
         # col1, col2 = st.columns(2)
         # with col1:
         #     if st.button("🗑️ 清理旧通知", use_container_width=True):
@@ -1,13 +1,13 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fivcadvisor import settings, utils
-from fivcadvisor.embeddings.types import (
-    EmbeddingDB,
-    EmbeddingFunction,
-)
+from fivcadvisor.embeddings.types import EmbeddingDB
+
+if TYPE_CHECKING:
+    from fivcadvisor.embeddings.types import EmbeddingFunction
 
 
-def _openai_embedding_function(*args, **kwargs) -> EmbeddingFunction:
+def _openai_embedding_function(*args, **kwargs) -> "EmbeddingFunction":
     from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
 
     return OpenAIEmbeddingFunction(
@@ -17,7 +17,7 @@ def _openai_embedding_function(*args, **kwargs) -> EmbeddingFunction:
     )
 
 
-def _ollama_embedding_function(*args, **kwargs) -> EmbeddingFunction:
+def _ollama_embedding_function(*args, **kwargs) -> "EmbeddingFunction":
     from chromadb.utils.embedding_functions import OllamaEmbeddingFunction
 
     return OllamaEmbeddingFunction(
@@ -26,7 +26,7 @@ def _ollama_embedding_function(*args, **kwargs) -> EmbeddingFunction:
     )
 
 
-def create_embedding_function(*args, **kwargs) -> EmbeddingFunction:
+def create_embedding_function(*args, **kwargs) -> "EmbeddingFunction":
     """Create a default embedding function for chromadb."""
     kwargs = utils.create_default_kwargs(kwargs, settings.default_embedder_config)
 
@@ -49,15 +49,24 @@ def create_embedding_function(*args, **kwargs) -> EmbeddingFunction:
 
 def create_embedding_db(
     *args,
-    function: Optional[EmbeddingFunction] = None,
+    function: Optional["EmbeddingFunction"] = None,
     output_dir: Optional[utils.OutputDir] = None,
+    persistent: bool = True,
+    warmup: bool = False,
     **kwargs,
 ) -> EmbeddingDB:
     """Create a default embedding database for chromadb."""
     return EmbeddingDB(
         output_dir=output_dir,
+        persistent=persistent,
+        warmup=warmup,
         function=function or create_embedding_function(**kwargs),
     )
 
 
-default_embedding_db = utils.create_lazy_value(lambda: create_embedding_db())
+default_embedding_db = utils.create_lazy_value(
+    lambda: create_embedding_db(warmup=True)
+)
+memory_embedding_db = utils.create_lazy_value(
+    lambda: create_embedding_db(persistent=False)
+)
@@ -4,8 +4,21 @@ __all__ = [
     "EmbeddingFunction",
 ]
 
+from typing import TYPE_CHECKING
+
 from .db import (
     EmbeddingDB,
     EmbeddingCollection,
-    EmbeddingFunction,
 )
+
+if TYPE_CHECKING:
+    from chromadb.utils.embedding_functions import EmbeddingFunction
+
+
+def __getattr__(name: str):
+    # resolve chromadb types on first use, importing chromadb is slow
+    if name == "EmbeddingFunction":
+        from chromadb.utils.embedding_functions import EmbeddingFunction
+
+        return EmbeddingFunction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
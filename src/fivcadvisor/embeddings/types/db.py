@@ -1,23 +1,64 @@
-from typing import Optional, Any, Dict
-
-import chromadb
-from chromadb.utils.embedding_functions import EmbeddingFunction
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+import mmap
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Any, Dict, List
 
 from fivcadvisor.utils import OutputDir
 
+if TYPE_CHECKING:
+    import chromadb
+    from chromadb.utils.embedding_functions import EmbeddingFunction
+
 
 class EmbeddingDB(object):
     def __init__(
         self,
-        function: Optional[EmbeddingFunction] = None,
+        function: Optional["EmbeddingFunction"] = None,
         output_dir: Optional[OutputDir] = None,
+        warmup: bool = False,
+        persistent: bool = True,
         **kwargs,
     ):
+        # chromadb is slow to import, defer it until a db is opened
+        import chromadb
+
         assert function is not None
         self.function = function
-        self.output_dir = output_dir or OutputDir().subdir("db")
-        self.db = chromadb.PersistentClient(path=str(self.output_dir))
+        if persistent:
+            self.output_dir = output_dir or OutputDir().subdir("db")
+            if warmup:
+                self.warmup()
+            self.db = chromadb.PersistentClient(path=str(self.output_dir))
+        else:
+            self.output_dir = None
+            self.db = chromadb.EphemeralClient()
+
+    def warmup(self) -> int:
+        """Prefetch the database and index files into the page cache.
+
+        Index lookups do random reads, so on a cold page cache the first
+        queries are dominated by disk I/O. Advising the kernel up front lets
+        it read the files ahead. No-op on platforms without madvise.
+
+        Returns:
+            Number of files prefetched.
+        """
+        advice = getattr(mmap, "MADV_WILLNEED", None)
+        if advice is None or self.output_dir is None:
+            return 0
+
+        num_files = 0
+        for path in self.output_dir.glob("**/*"):
+            if path.name != "chroma.sqlite3" and path.suffix != ".bin":
+                continue
+            try:
+                with open(path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        m.madvise(advice)
+            except (OSError, ValueError):
+                # unreadable or empty file
+                continue
+            num_files += 1
+        return num_files
 
     def get_collection(self, name: str) -> "EmbeddingCollection":
         return EmbeddingCollection(
@@ -27,21 +68,57 @@ class EmbeddingDB(object):
             )
         )
 
+    def delete_collection(self, name: str):
+        """Drop the collection and its documents from the database."""
+        self.db.delete_collection(name)
+
 
 class EmbeddingCollection(object):
-    def __init__(self, collection: chromadb.Collection):
+    def __init__(self, collection: "chromadb.Collection", chunk_size: int = 2000):
         self.collection = collection
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=2000, chunk_overlap=100
+        self.chunk_size = chunk_size
+
+    @cached_property
+    def text_splitter(self):
+        # langchain is slow to import, defer it until a long text shows up
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        return RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size, chunk_overlap=100
         )
 
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into chunks, short texts are kept as a single chunk."""
+        if len(text) > self.chunk_size:
+            return self.text_splitter.split_text(text)
+
+        text = text.strip()
+        return [text] if text else []
+
     def add(self, text: str, metadata: Optional[Dict[str, Any]] = None):
         """Add text to the collection."""
-        chunks = self.text_splitter.split_text(text)
+        self.add_batch([text], metadatas=[metadata] if metadata else None)
+
+    def add_batch(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """Add texts to the collection, embedding them in a single call."""
+        chunk_map = {}
+        for i, text in enumerate(texts):
+            for chunk in self._split_text(text):
+                chunk_map.setdefault(
+                    str(hash(chunk)), (chunk, metadatas[i] if metadatas else None)
+                )
+        if not chunk_map:
+            return
+
+        chunk_docs, chunk_metas = zip(*chunk_map.values())
         self.collection.add(
-            documents=chunks,
-            metadatas=([metadata] * len(chunks)) if metadata else None,
-            ids=[str(hash(chunk)) for chunk in chunks],
+            documents=list(chunk_docs),
+            metadatas=list(chunk_metas) if metadatas else None,
+            ids=list(chunk_map.keys()),
         )
 
     def search(self, query: str, num_documents: int = 10) -> list:
@@ -20,7 +20,6 @@ This structure allows for:
     - Human-readable JSON format
 """
 
-import json
 import shutil
 from pathlib import Path
 from typing import Optional, List
@@ -80,10 +79,10 @@ class FileTaskRuntimeRepository(TaskRuntimeRepository):
         task_file = self._get_task_file(str(task.id))
 
         # Serialize task to JSON (exclude steps as they're stored separately)
-        task_data = task.model_dump(mode="json", exclude={"steps"})
+        task_json = task.model_dump_json(indent=2, exclude={"steps"})
 
         with open(task_file, "w", encoding="utf-8") as f:
-            json.dump(task_data, f, indent=2, ensure_ascii=False)
+            f.write(task_json)
 
     def get_task_runtime(self, task_id: str) -> Optional[TaskRuntime]:
         """
@@ -102,12 +101,12 @@ class FileTaskRuntimeRepository(TaskRuntimeRepository):
 
         try:
             with open(task_file, "r", encoding="utf-8") as f:
-                task_data = json.load(f)
+                task_json = f.read()
 
             # Reconstruct TaskRuntime from JSON
             # Note: steps are loaded separately via list_task_runtime_steps
-            return TaskRuntime.model_validate(task_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return TaskRuntime.model_validate_json(task_json)
+        except ValueError as e:
             # Log error and return None if file is corrupted
             print(f"Error loading task {task_id}: {e}")
             return None
@@ -168,11 +167,11 @@ class FileTaskRuntimeRepository(TaskRuntimeRepository):
 
         try:
             with open(step_file, "r", encoding="utf-8") as f:
-                step_data = json.load(f)
+                step_json = f.read()
 
             # Reconstruct TaskRuntimeStep from JSON
-            return TaskRuntimeStep.model_validate(step_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return TaskRuntimeStep.model_validate_json(step_json)
+        except ValueError as e:
             # Log error and return None if file is corrupted
             print(f"Error loading step {step_id} for task {task_id}: {e}")
             return None
@@ -191,10 +190,10 @@ class FileTaskRuntimeRepository(TaskRuntimeRepository):
         step_file = self._get_step_file(task_id, step.id)
 
         # Serialize step to JSON
-        step_data = step.model_dump(mode="json")
+        step_json = step.model_dump_json(indent=2)
 
         with open(step_file, "w", encoding="utf-8") as f:
-            json.dump(step_data, f, indent=2, ensure_ascii=False)
+            f.write(step_json)
 
     def list_task_runtime_steps(self, task_id: str) -> List[TaskRuntimeStep]:
         """
@@ -16,9 +16,7 @@ from fivcadvisor.utils import create_lazy_value
 from fivcadvisor.tools.types import ToolsRetriever, ToolsConfig
 
 
-def register_default_tools(tools_retriever: Optional[ToolsRetriever] = None, **kwargs):
-    assert tools_retriever is not None
-
+def _load_default_tools() -> tuple:
     from strands.tools.registry import ToolRegistry
     from strands_tools import (
         calculator,
@@ -42,7 +40,17 @@ def register_default_tools(tools_retriever: Optional[ToolsRetriever] = None, **k
             # browser,
         ]
     )
-    tools = [r.registry.get(name) for name in tool_names]
+    return tuple(r.registry.get(name) for name in tool_names)
+
+
+# resolved once and shared by every retriever
+_default_tools = create_lazy_value(_load_default_tools)
+
+
+def register_default_tools(tools_retriever: Optional[ToolsRetriever] = None, **kwargs):
+    assert tools_retriever is not None
+
+    tools = list(_default_tools())
     tools_retriever.add_batch(tools)
 
     return tools
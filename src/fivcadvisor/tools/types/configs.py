@@ -1,9 +1,13 @@
 import os
-from typing import Optional, List, Dict
+from copy import deepcopy
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
 
-from mcp import StdioServerParameters, stdio_client
-from mcp.client.sse import sse_client
-from strands.tools.mcp import MCPClient
+if TYPE_CHECKING:
+    from strands.tools.mcp import MCPClient
+
+# Parsed config files keyed by absolute path, with the (mtime, size) they were
+# parsed at, so re-reading an unchanged file skips the YAML/JSON parse.
+_parsed_files: Dict[str, Tuple[Tuple[int, int], dict]] = {}
 
 
 class ToolsConfigValue(dict):
@@ -62,7 +66,7 @@ class ToolsConfigValue(dict):
 
         return True
 
-    def get_client(self) -> Optional[MCPClient]:
+    def get_client(self) -> Optional["MCPClient"]:
         """Create and return an MCPClient based on the configuration.
 
         Supports two types of MCP server configurations:
@@ -78,14 +82,18 @@ class ToolsConfigValue(dict):
         if not self.validate():
             return None
 
+        # mcp is slow to import, only load it once a client is needed
+        from mcp import StdioServerParameters, stdio_client
+        from mcp.client.sse import sse_client
+        from strands.tools.mcp import MCPClient
+
         if "command" in self:
             # Command-based configuration
             command = self["command"]
             args = self.get("args") or []
-            env = self.get("env") or {}
 
-            # Merge with environment variables
-            env.update(os.environ)
+            # Merge with environment variables, without mutating the config
+            env = {**(self.get("env") or {}), **os.environ}
 
             return MCPClient(
                 lambda: stdio_client(
@@ -169,14 +177,22 @@ class ToolsConfig(object):
             filename = self._config_file
         self._save_file(filename)
 
-    def load(self, filename: Optional[str] = None) -> None:
+    def load(self, filename: Optional[str] = None, force_reload: bool = False) -> None:
+        """Load configuration from a file.
+
+        Args:
+            filename: Path to load the configuration from. If None, loads from
+                     the original config_file path.
+            force_reload: Parse the file even if it is unchanged since it was
+                         last parsed.
+        """
         if filename is None:
             filename = self._config_file
 
         # Clear configs but preserve any errors from _load_file
         self._configs.clear()
 
-        configs = self._load_file(filename)
+        configs = self._load_file(filename, force_reload=force_reload)
 
         for k, v in configs.items():
             # Store all configs as-is (can be dicts or ToolsConfigValue)
@@ -259,27 +275,44 @@ class ToolsConfig(object):
             self._errors.append(e)
             return {}
 
-    def _load_file(self, filename):
+    def _load_file(self, filename, force_reload: bool = False):
         """Load configuration from a file based on its extension.
 
         Determines the file format (YAML or JSON) based on the file extension
-        and calls the appropriate load method.
+        and calls the appropriate load method. Files that have not changed
+        since they were last parsed are served from a module-level cache.
 
         Args:
             filename: Path to the file to load. Extension determines format.
+            force_reload: Parse the file even if a cached result is available.
 
         Returns:
             Dictionary containing the parsed configuration, or empty dict on error.
         """
+        filename = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+            file_key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_key = None
+
+        cached = _parsed_files.get(filename)
+        if not force_reload and file_key and cached and cached[0] == file_key:
+            return deepcopy(cached[1])
+
         ext = filename.split(".")[-1]
         if ext in ["yml", "yaml"]:
-            return self._load_yaml_file(filename)
+            conf = self._load_yaml_file(filename)
         elif ext == "json":
-            return self._load_json_file(filename)
+            conf = self._load_json_file(filename)
         else:
             self._errors.append(ValueError(f"Unsupported config file type: {ext}"))
             return {}
 
+        if file_key and conf:
+            _parsed_files[filename] = (file_key, deepcopy(conf))
+        return conf
+
     def _save_yaml_file(self, filename: str):
         """Save configuration to a YAML file.
 
@@ -1,9 +1,14 @@
 from typing import List, Optional, Dict
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
 from strands.types.tools import AgentTool
 from strands.tools import tool as make_tool
 from fivcadvisor import embeddings
+from fivcadvisor.embeddings.types import EmbeddingCollection
+
+# metadata key holding the tool name of an indexed description
+_TOOL_KEY = "__tool__"
 
 
 class ToolsRetriever(object):
@@ -11,18 +16,31 @@ class ToolsRetriever(object):
         self.max_num = 10  # top k
         self.min_score = 0.0  # min score
         self.tools: dict[str, AgentTool] = {}
-        db = db or embeddings.default_embedding_db
-        self.collection = db.get_collection("tools")
-        self.collection.clear()  # clean up any old data
+        self._tool: Optional[AgentTool] = None
+        self._db = db or embeddings.memory_embedding_db
+        # a collection of its own, so retrievers on one db never clear each other
+        self._collection_name = f"tools_{uuid4().hex}"
+        self._collection: Optional[EmbeddingCollection] = self._db.get_collection(
+            self._collection_name
+        )
 
     def __str__(self):
         return f"ToolsRetriever(num_tools={len(self.tools)})"
 
+    @property
+    def collection(self) -> EmbeddingCollection:
+        if self._collection is None:
+            # reopened after cleanup dropped it
+            self._collection = self._db.get_collection(self._collection_name)
+        return self._collection
+
     def cleanup(self):
         self.max_num = 10  # top k
         self.min_score = 0.0  # min score
         self.tools.clear()
-        self.collection.clear()
+        if self._collection is not None:
+            self._db.delete_collection(self._collection_name)
+            self._collection = None
 
     def add(self, tool: AgentTool, **kwargs):
         tool_name = tool.tool_name
@@ -35,20 +53,39 @@ class ToolsRetriever(object):
 
         self.collection.add(
             tool_desc,
-            metadata={"__tool__": tool_name},
+            metadata={_TOOL_KEY: tool_name},
         )
         self.tools[tool_name] = tool
-        print(f"Total Docs {self.collection.count()} in ToolsRetriever")
 
     def add_batch(self, tools: List[AgentTool]):
+        tool_descs = {}
         for tool in tools:
-            self.add(tool)
+            tool_name = tool.tool_name
+            if tool_name in self.tools or tool_name in tool_descs:
+                raise ValueError(f"Duplicate tool name: {tool_name}")
+
+            tool_desc = tool.tool_spec.get("description")
+            if not tool_desc:
+                raise ValueError(f"Tool description is empty: {tool_name}")
+
+            tool_descs[tool_name] = tool_desc
+
+        if not tool_descs:
+            return
+
+        self.collection.add_batch(
+            list(tool_descs.values()),
+            metadatas=[{_TOOL_KEY: tool_name} for tool_name in tool_descs],
+        )
+        for tool in tools:
+            self.tools[tool.tool_name] = tool
 
     def get(self, name: str) -> Optional[AgentTool]:
         return self.tools.get(name)
 
     def get_batch(self, names: List[str]) -> List[AgentTool]:
-        return [self.get(name) for name in names]
+        tools_get = self.tools.get
+        return [tools_get(name) for name in names]
 
     def get_all(self) -> List[AgentTool]:
         return list(self.tools.values())
@@ -75,12 +112,13 @@ class ToolsRetriever(object):
             num_documents=self.retrieve_max_num,
         )
 
-        tool_names = set(
-            src["metadata"]["__tool__"]
-            for src in sources
-            if src["score"] >= self.retrieve_min_score
+        # keep the search ranking, a tool may match on several chunks
+        min_score = self.retrieve_min_score
+        tool_names = dict.fromkeys(
+            src["metadata"][_TOOL_KEY] for src in sources if src["score"] >= min_score
         )
-        return [self.get(name) for name in tool_names]
+        tools_get = self.tools.get
+        return [t for t in map(tools_get, tool_names) if t is not None]
 
     def __call__(self, *args, **kwargs) -> List[Dict]:
         tools = self.retrieve(*args, **kwargs)
@@ -92,11 +130,15 @@ class ToolsRetriever(object):
     class _ToolSchema(BaseModel):
         query: str = Field(description="The task to find the best tool for")
 
+    _tool_schema = _ToolSchema.model_json_schema()
+
     def to_tool(self):
-        """Convert the retriever to a tool."""
-        return make_tool(
-            name="tools_retriever",
-            description="Use this tool to retrieve the best tools for a given task",
-            inputSchema=self._ToolSchema.model_json_schema(),
-            context=False,
-        )(self.__call__)
+        """Convert the retriever to a tool, built once and reused."""
+        if self._tool is None:
+            self._tool = make_tool(
+                name="tools_retriever",
+                description="Use this tool to retrieve the best tools for a given task",
+                inputSchema=self._tool_schema,
+                context=False,
+            )(self.__call__)
+        return self._tool
@@ -4,7 +4,7 @@ Tests for the agent_creator decorator and related functionality.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from fivcadvisor.agents.types import (
     AgentsRetriever,
@@ -237,5 +237,37 @@ class TestAgentsCreatorBase:
         assert isinstance(agent, Mock)
 
 
+class TestCreateGenericAgentSwarm:
+    """Test the create_generic_agent_swarm factory."""
+
+    def test_shared_tools_fetched_once(self):
+        """Test that tools shared by specialists are fetched once."""
+        from fivcadvisor import agents
+        from fivcadvisor.tasks.types import TaskTeam
+
+        team = TaskTeam(
+            specialists=[
+                TaskTeam.Specialist(name="a", backstory="A", tools=["t1", "t2"]),
+                TaskTeam.Specialist(name="b", backstory="B", tools=["t2", "t3"]),
+            ]
+        )
+        tool1, tool2 = Mock(), Mock()
+        tools_retriever = Mock()
+        tools_retriever.get_batch.return_value = [tool1, tool2, None]
+
+        with (
+            patch("fivcadvisor.agents.create_default_agent") as mock_create,
+            patch("fivcadvisor.agents.Swarm") as mock_swarm,
+        ):
+            agents.create_generic_agent_swarm(
+                team=team, tools_retriever=tools_retriever
+            )
+
+        tools_retriever.get_batch.assert_called_once_with(["t1", "t2", "t3"])
+        assert mock_create.call_args_list[0][1]["tools"] == [tool1, tool2]
+        assert mock_create.call_args_list[1][1]["tools"] == [tool2]
+        mock_swarm.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -13,6 +13,8 @@ Tests the chat utility for handling conversation state and agent execution:
 - ChatManager functionality
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from fivcadvisor.app.utils import Chat, ChatManager
@@ -392,6 +394,115 @@ class TestChatAsk:
         # Running should be reset even after exception
         assert manager.running is False
 
+    @pytest.mark.asyncio
+    async def test_ask_discards_uncommitted_new_chat(self):
+        """Test a rejected answer on a new chat deletes the agent data."""
+        mock_retriever = Mock(spec=tools.ToolsRetriever)
+        mock_repo = Mock(spec=AgentsRuntimeRepository)
+
+        manager = Chat(agent_runtime_repo=mock_repo, tools_retriever=mock_retriever)
+
+        mock_agent = AsyncMock()
+        mock_agent.invoke_async = AsyncMock(return_value="response")
+        mock_agent.agent_id = "test-agent"
+
+        manager.monitor_manager.create_agent_runtime = Mock(return_value=mock_agent)
+
+        with patch(
+            "fivcadvisor.app.utils.chats.tasks.run_briefing_task"
+        ) as mock_briefing:
+            result = await manager.ask("query", commit=AsyncMock(return_value=False))
+
+        assert result is None
+        assert manager.runtime_meta is None
+        mock_briefing.assert_not_called()
+        mock_repo.update_agent.assert_not_called()
+        mock_repo.delete_agent.assert_called_once_with("test-agent")
+
+    @pytest.mark.asyncio
+    async def test_ask_discards_cancelled_run(self):
+        """Test a cancelled answer deletes only its own run."""
+        mock_retriever = Mock(spec=tools.ToolsRetriever)
+        mock_repo = Mock(spec=AgentsRuntimeRepository)
+        meta = AgentsRuntimeMeta(agent_id="existing-agent")
+
+        manager = Chat(
+            agent_runtime_meta=meta,
+            agent_runtime_repo=mock_repo,
+            tools_retriever=mock_retriever,
+        )
+
+        mock_agent = AsyncMock()
+        mock_agent.invoke_async = AsyncMock(side_effect=asyncio.CancelledError)
+        mock_agent.agent_id = "existing-agent"
+        mock_agent.callback_handler = Mock(id="run-1")
+
+        manager.monitor_manager.create_agent_runtime = Mock(return_value=mock_agent)
+
+        with pytest.raises(asyncio.CancelledError):
+            await manager.ask("query", commit=AsyncMock(return_value=True))
+
+        mock_repo.delete_agent_runtime.assert_called_once_with(
+            "existing-agent", "run-1"
+        )
+        mock_repo.delete_agent.assert_not_called()
+        assert manager.running is False
+
+    @pytest.mark.asyncio
+    async def test_ask_keeps_committed_run(self):
+        """Test an accepted answer is kept."""
+        mock_retriever = Mock(spec=tools.ToolsRetriever)
+        mock_repo = Mock(spec=AgentsRuntimeRepository)
+        meta = AgentsRuntimeMeta(agent_id="existing-agent")
+
+        manager = Chat(
+            agent_runtime_meta=meta,
+            agent_runtime_repo=mock_repo,
+            tools_retriever=mock_retriever,
+        )
+
+        mock_agent = AsyncMock()
+        mock_agent.invoke_async = AsyncMock(return_value="response")
+
+        manager.monitor_manager.create_agent_runtime = Mock(return_value=mock_agent)
+
+        result = await manager.ask("query", commit=AsyncMock(return_value=True))
+
+        assert result == "response"
+        mock_repo.delete_agent_runtime.assert_not_called()
+        mock_repo.delete_agent.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ask_discards_run_when_commit_fails(self):
+        """Test a failing commit deletes the run and propagates the error."""
+        mock_retriever = Mock(spec=tools.ToolsRetriever)
+        mock_repo = Mock(spec=AgentsRuntimeRepository)
+        meta = AgentsRuntimeMeta(agent_id="existing-agent")
+
+        manager = Chat(
+            agent_runtime_meta=meta,
+            agent_runtime_repo=mock_repo,
+            tools_retriever=mock_retriever,
+        )
+
+        mock_agent = AsyncMock()
+        mock_agent.invoke_async = AsyncMock(return_value="response")
+        mock_agent.agent_id = "existing-agent"
+        mock_agent.callback_handler = Mock(id="run-1")
+
+        manager.monitor_manager.create_agent_runtime = Mock(return_value=mock_agent)
+
+        with pytest.raises(RuntimeError, match="assessment failed"):
+            await manager.ask(
+                "query",
+                commit=AsyncMock(side_effect=RuntimeError("assessment failed")),
+            )
+
+        mock_repo.delete_agent_runtime.assert_called_once_with(
+            "existing-agent", "run-1"
+        )
+        assert manager.running is False
+
 
 class TestChatCleanup:
     """Test cleanup functionality."""
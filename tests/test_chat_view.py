@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for the chat view.
+
+Tests how ChatView._ask combines the task assessment with the chat answer:
+- Tasks disabled
+- Assessment before answering
+- Speculative answering while assessing
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from fivcadvisor.app.views.chats import ChatView
+from fivcadvisor.tasks import TaskAssessment
+
+
+def _create_view(chat_ask=None):
+    chat = Mock()
+    chat.id = "chat-1"
+    chat.description = "Chat"
+    chat.ask = chat_ask or AsyncMock(return_value="response")
+    return ChatView(chat)
+
+
+def _running_config(**config):
+    running_config = Mock()
+    running_config.get.side_effect = lambda key: config.get(key)
+    return running_config
+
+
+class TestChatViewAsk:
+    """Test the ChatView._ask method."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_disabled(self):
+        """Test the query is answered without assessment."""
+        view = _create_view()
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=False),
+            ),
+            patch("fivcadvisor.app.views.chats.run_assessing_task") as mock_assess,
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is None
+        mock_assess.assert_not_called()
+        view.chat.ask.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_assess_then_plan(self):
+        """Test the chat is not asked when planning is required."""
+        view = _create_view()
+        planning = TaskAssessment(require_planning=True, reasoning="complex")
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=True),
+            ),
+            patch(
+                "fivcadvisor.app.views.chats.run_assessing_task",
+                AsyncMock(return_value=planning),
+            ),
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is planning
+        view.chat.ask.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_assess_then_answer(self):
+        """Test the chat is asked when no planning is required."""
+        view = _create_view()
+        direct = TaskAssessment(require_planning=False, reasoning="simple")
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=True),
+            ),
+            patch(
+                "fivcadvisor.app.views.chats.run_assessing_task",
+                AsyncMock(return_value=direct),
+            ),
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is None
+        view.chat.ask.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_speculative_answer_committed(self):
+        """Test the speculative answer is committed when no planning is required."""
+        commits = []
+
+        async def chat_ask(query, on_event=None, commit=None):
+            commits.append(await commit())
+            return "response"
+
+        view = _create_view(chat_ask)
+        direct = TaskAssessment(require_planning=False, reasoning="simple")
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=True, speculative_chat=True),
+            ),
+            patch(
+                "fivcadvisor.app.views.chats.run_assessing_task",
+                AsyncMock(return_value=direct),
+            ),
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is None
+        assert commits == [True]
+
+    @pytest.mark.asyncio
+    async def test_speculative_answer_cancelled(self):
+        """Test the speculative answer is cancelled when planning is required."""
+        cancelled = []
+
+        async def chat_ask(query, on_event=None, commit=None):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+
+        view = _create_view(chat_ask)
+        planning = TaskAssessment(require_planning=True, reasoning="complex")
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=True, speculative_chat=True),
+            ),
+            patch(
+                "fivcadvisor.app.views.chats.run_assessing_task",
+                AsyncMock(return_value=planning),
+            ),
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is planning
+        assert cancelled == ["query"]
+
+    @pytest.mark.asyncio
+    async def test_speculative_answer_failed(self):
+        """Test a failed speculative answer is ignored when planning is required."""
+        view = _create_view(AsyncMock(side_effect=RuntimeError("model error")))
+        planning = TaskAssessment(require_planning=True, reasoning="complex")
+
+        async def assess(*args, **kwargs):
+            await asyncio.sleep(0)
+            return planning
+
+        with (
+            patch(
+                "fivcadvisor.app.views.chats.default_running_config",
+                _running_config(enable_tasks=True, speculative_chat=True),
+            ),
+            patch("fivcadvisor.app.views.chats.run_assessing_task", assess),
+        ):
+            assessment = await view._ask("query")
+
+        assert assessment is planning
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
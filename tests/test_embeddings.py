@@ -3,6 +3,8 @@
 Tests for the embeddings module.
 """
 
+import mmap
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -48,6 +50,35 @@ class TestEmbeddingCollection:
         assert "metadatas" in call_args
         assert "ids" in call_args
 
+    def test_add_batch(self, mock_chroma_collection):
+        """Test adding several documents in one insert."""
+        collection = EmbeddingCollection(mock_chroma_collection)
+
+        collection.add_batch(
+            ["doc a", "doc b", "doc a"],
+            metadatas=[{"key": "a"}, {"key": "b"}, {"key": "c"}],
+        )
+
+        mock_chroma_collection.add.assert_called_once()
+        call_args = mock_chroma_collection.add.call_args[1]
+        assert call_args["documents"] == ["doc a", "doc b"]
+        assert call_args["metadatas"] == [{"key": "a"}, {"key": "b"}]
+        assert len(call_args["ids"]) == 2
+
+    def test_add_long_document(self, mock_chroma_collection):
+        """Test that only long documents go through the text splitter."""
+        collection = EmbeddingCollection(mock_chroma_collection, chunk_size=100)
+
+        collection.add("short document")
+        assert "text_splitter" not in collection.__dict__
+        documents = mock_chroma_collection.add.call_args[1]["documents"]
+        assert documents == ["short document"]
+
+        collection.add(" ".join(f"word{i}" for i in range(100)))
+        assert "text_splitter" in collection.__dict__
+        documents = mock_chroma_collection.add.call_args[1]["documents"]
+        assert len(documents) > 1
+
     def test_search(self, mock_chroma_collection):
         """Test searching documents."""
         collection = EmbeddingCollection(mock_chroma_collection)
@@ -113,7 +144,7 @@ class TestEmbeddingDB:
         mock_client.get_or_create_collection = Mock(return_value=mock_collection)
         return mock_client
 
-    @patch("fivcadvisor.embeddings.types.db.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_init(self, mock_chroma_class, mock_embedding_function):
         """Test EmbeddingDB initialization."""
         mock_client = Mock()
@@ -125,7 +156,7 @@ class TestEmbeddingDB:
         assert db.db == mock_client
         mock_chroma_class.assert_called_once()
 
-    @patch("fivcadvisor.embeddings.types.db.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_get_collection(self, mock_chroma_class, mock_embedding_function):
         """Test getting a collection."""
         mock_client = Mock()
@@ -141,6 +172,69 @@ class TestEmbeddingDB:
             "test_collection", embedding_function=mock_embedding_function
         )
 
+    @patch("chromadb.PersistentClient")
+    def test_delete_collection(self, mock_chroma_class, mock_embedding_function):
+        """Test deleting a collection."""
+        mock_client = Mock()
+        mock_chroma_class.return_value = mock_client
+
+        db = EmbeddingDB(function=mock_embedding_function)
+        db.delete_collection("test_collection")
+
+        mock_client.delete_collection.assert_called_once_with("test_collection")
+
+    @patch("chromadb.PersistentClient")
+    @patch("chromadb.EphemeralClient")
+    def test_init_in_memory(
+        self, mock_ephemeral_class, mock_persistent_class, mock_embedding_function
+    ):
+        """Test EmbeddingDB initialization without persistence."""
+        mock_client = Mock()
+        mock_ephemeral_class.return_value = mock_client
+
+        db = EmbeddingDB(function=mock_embedding_function, persistent=False)
+
+        assert db.db == mock_client
+        assert db.output_dir is None
+        assert db.warmup() == 0
+        mock_persistent_class.assert_not_called()
+
+    @patch("chromadb.PersistentClient")
+    def test_warmup(self, mock_chroma_class, mock_embedding_function, tmp_path):
+        """Test prefetching index files."""
+        from fivcadvisor.utils import OutputDir
+
+        (tmp_path / "chroma.sqlite3").write_bytes(b"sqlite")
+        (tmp_path / "segment").mkdir()
+        (tmp_path / "segment" / "data_level0.bin").write_bytes(b"data")
+        (tmp_path / "segment" / "length.bin").write_bytes(b"")
+        (tmp_path / "segment" / "notes.txt").write_bytes(b"text")
+
+        db = EmbeddingDB(
+            function=mock_embedding_function,
+            output_dir=OutputDir(str(tmp_path)),
+        )
+
+        if hasattr(mmap, "MADV_WILLNEED"):
+            assert db.warmup() == 2
+        else:
+            assert db.warmup() == 0
+
+    @patch("chromadb.PersistentClient")
+    def test_warmup_opt_in(self, mock_chroma_class, mock_embedding_function, tmp_path):
+        """Test the database is only prefetched when asked for."""
+        from fivcadvisor.utils import OutputDir
+
+        output_dir = OutputDir(str(tmp_path))
+        with patch.object(EmbeddingDB, "warmup") as mock_warmup:
+            EmbeddingDB(function=mock_embedding_function, output_dir=output_dir)
+            mock_warmup.assert_not_called()
+
+            EmbeddingDB(
+                function=mock_embedding_function, output_dir=output_dir, warmup=True
+            )
+            mock_warmup.assert_called_once()
+
 
 class TestCreateEmbeddingFunction:
     """Test the create_embedding_function function."""
@@ -259,6 +353,17 @@ class TestCreateEmbeddingDB:
         call_kwargs = mock_db_class.call_args[1]
         assert call_kwargs["function"] == mock_func
 
+    @patch("fivcadvisor.embeddings.EmbeddingDB")
+    def test_create_embedding_db_warmup(self, mock_db_class):
+        """Test prefetching is only requested when asked for."""
+        from fivcadvisor.embeddings import create_embedding_db
+
+        create_embedding_db(function=Mock())
+        assert mock_db_class.call_args[1]["warmup"] is False
+
+        create_embedding_db(function=Mock(), warmup=True)
+        assert mock_db_class.call_args[1]["warmup"] is True
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -6,6 +6,7 @@ Tests for the tools/types/configs module.
 import os
 import tempfile
 import pytest
+from unittest.mock import patch
 
 from fivcadvisor.tools.types.configs import ToolsConfig, ToolsConfigValue
 
@@ -688,5 +689,59 @@ another_server:
         assert "url: http://localhost:8000" in yaml_str
 
 
+class TestToolsConfigCache:
+    """Test caching of parsed configuration files."""
+
+    def test_load_unchanged_file_uses_cache(self):
+        """Test that reloading an unchanged file does not parse it again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "test.yaml")
+            with open(config_path, "w") as f:
+                f.write("test_server:\n  command: python\n")
+
+            config = ToolsConfig(config_path)
+            assert "test_server" in config.list()
+
+            with patch.object(
+                ToolsConfig, "_load_yaml_file", side_effect=AssertionError
+            ):
+                config.load()
+            assert "test_server" in config.list()
+
+            with patch.object(
+                ToolsConfig, "_load_yaml_file", return_value={}
+            ) as mock_load:
+                config.load(force_reload=True)
+            mock_load.assert_called_once()
+
+    def test_load_changed_file_reparses(self):
+        """Test that a modified file is parsed again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "test.yaml")
+            with open(config_path, "w") as f:
+                f.write("test_server:\n  command: python\n")
+
+            config = ToolsConfig(config_path)
+            config.set("another_server", {"url": "http://localhost:8000"})
+            config.save()
+
+            config = ToolsConfig(config_path)
+            assert set(config.list()) == {"test_server", "another_server"}
+
+    def test_cached_configs_are_not_shared(self):
+        """Test that mutating a loaded config does not leak into the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "test.yaml")
+            with open(config_path, "w") as f:
+                f.write("test_server:\n  command: python\n  env:\n    A: '1'\n")
+
+            config = ToolsConfig(config_path)
+            config.get("test_server").get_client()
+            config.get("test_server")["env"]["B"] = "2"
+
+            config = ToolsConfig(config_path)
+            assert config.get("test_server")["env"] == {"A": "1"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
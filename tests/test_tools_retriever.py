@@ -40,7 +40,20 @@ class TestToolsRetriever:
         assert retriever.min_score == 0.0
         assert isinstance(retriever.tools, dict)
         assert len(retriever.tools) == 0
-        mock_embedding_db.get_collection.assert_called_once_with("tools")
+        mock_embedding_db.get_collection.assert_called_once()
+        retriever.collection.clear.assert_not_called()
+
+    def test_init_separate_collections(self, mock_embedding_db):
+        """Test that retrievers on the same db do not share a collection."""
+        ToolsRetriever(db=mock_embedding_db)
+        ToolsRetriever(db=mock_embedding_db)
+
+        (first,), (second,) = [
+            call.args for call in mock_embedding_db.get_collection.call_args_list
+        ]
+        assert first.startswith("tools_")
+        assert second.startswith("tools_")
+        assert first != second
 
     def test_str(self, mock_embedding_db):
         """Test string representation."""
@@ -60,7 +73,15 @@ class TestToolsRetriever:
         assert retriever.max_num == 10
         assert retriever.min_score == 0.0
         assert len(retriever.tools) == 0
-        assert retriever.collection.clear.call_count >= 1
+        (name,) = mock_embedding_db.get_collection.call_args.args
+        mock_embedding_db.delete_collection.assert_called_once_with(name)
+
+        # the collection is reopened on next use, and dropped only once
+        retriever.collection
+        assert mock_embedding_db.get_collection.call_count == 2
+        retriever.cleanup()
+        retriever.cleanup()
+        assert mock_embedding_db.delete_collection.call_count == 2
 
     def test_add_tool(self, mock_embedding_db, mock_tool):
         """Test adding a tool."""
@@ -107,6 +128,24 @@ class TestToolsRetriever:
         assert len(retriever.tools) == 2
         assert "tool1" in retriever.tools
         assert "tool2" in retriever.tools
+        retriever.collection.add_batch.assert_called_once_with(
+            ["Tool 1", "Tool 2"],
+            metadatas=[{"__tool__": "tool1"}, {"__tool__": "tool2"}],
+        )
+
+    def test_add_batch_duplicate_tool(self, mock_embedding_db):
+        """Test that a duplicate in a batch adds nothing."""
+        retriever = ToolsRetriever(db=mock_embedding_db)
+
+        tool1 = Mock()
+        tool1.tool_name = "tool1"
+        tool1.tool_spec = {"description": "Tool 1"}
+
+        with pytest.raises(ValueError, match="Duplicate tool name"):
+            retriever.add_batch([tool1, tool1])
+
+        assert len(retriever.tools) == 0
+        retriever.collection.add_batch.assert_not_called()
 
     def test_get_tool(self, mock_embedding_db, mock_tool):
         """Test getting a tool by name."""
@@ -261,6 +300,31 @@ class TestToolsRetriever:
         assert tool1 in results
         assert tool2 not in results
 
+    def test_retrieve_keeps_ranking(self, mock_embedding_db):
+        """Test that retrieved tools follow the search ranking without duplicates."""
+        retriever = ToolsRetriever(db=mock_embedding_db)
+
+        tool1 = Mock()
+        tool1.tool_name = "calculator"
+        tool1.tool_spec = {"description": "Calculate math"}
+
+        tool2 = Mock()
+        tool2.tool_name = "search"
+        tool2.tool_spec = {"description": "Search the web"}
+
+        retriever.add_batch([tool1, tool2])
+
+        retriever.collection.search = Mock(
+            return_value=[
+                {"text": "a", "metadata": {"__tool__": "search"}, "score": 0.9},
+                {"text": "b", "metadata": {"__tool__": "calculator"}, "score": 0.8},
+                {"text": "c", "metadata": {"__tool__": "search"}, "score": 0.7},
+                {"text": "d", "metadata": {"__tool__": "unknown"}, "score": 0.6},
+            ]
+        )
+
+        assert retriever.retrieve("query") == [tool2, tool1]
+
     def test_call(self, mock_embedding_db):
         """Test calling retriever as a function."""
         retriever = ToolsRetriever(db=mock_embedding_db)
@@ -298,6 +362,7 @@ class TestToolsRetriever:
         assert hasattr(tool, "tool_name")
         # The tool should be callable
         assert callable(tool)
+        assert retriever.to_tool() is tool
 
 
 if __name__ == "__main__":